@@ -1,22 +1,20 @@
 from django.shortcuts import render
 
-# pylint: disable-next=unused-argument
-def error_404(request, exception=None):
+
+def _render_error(request, template_name, status):
     context = {
         'show_language_toggle': True,
     }
-    return render(request, '404.html', context, status=404)
+    return render(request, template_name, context, status=status)
+
+# pylint: disable-next=unused-argument
+def error_404(request, exception=None):
+    return _render_error(request, '404.html', 404)
 
 # pylint: disable-next=unused-argument
 def error_403(request, exception=None):
-    context = {
-        'show_language_toggle': True,
-    }
-    return render(request, '403.html', context, status=403)
+    return _render_error(request, '403.html', 403)
 
 # pylint: disable-next=unused-argument
 def error_500(request, exception=None):
-    context = {
-        'show_language_toggle': True,  
-    }
-    return render(request, '500.html', context, status=500)
+    return _render_error(request, '500.html', 500)
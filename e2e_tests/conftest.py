@@ -6,6 +6,22 @@ import pytest
 import requests
 
 
+BASE_URL = "http://localhost:8000"
+# Pages that the tests hit. The server is considered ready when all of them
+# respond without a server error twice in a row.
+READINESS_PATHS = ("/", "/accounts/login/", "/def/current/")
+
+
+def _is_ready() -> bool:
+    try:
+        return all(
+            requests.get(BASE_URL + path, timeout=5).status_code < 500
+            for path in READINESS_PATHS
+        )
+    except requests.RequestException:
+        return False
+
+
 @pytest.fixture(scope="session", autouse=True)
 def django_server():
     # Start containers
@@ -14,18 +30,17 @@ def django_server():
     server_process = subprocess.Popen([os.path.join(path, "run_servers.sh")], stdin=subprocess.PIPE)
 
     # Wait 2 minutes for the server to be ready
-    max_retries = 120
-    for _ in range(max_retries):
-        try:
-            response = requests.get("http://localhost:8000/") # pylint: disable=missing-timeout
-            if response.status_code == 200:
-                # Wait a bit more to let the server settle (tests may fail otherwise)
-                time.sleep(10)
-                break
-        except requests.ConnectionError:
-            pass
-
-        time.sleep(1)
+    deadline = time.monotonic() + 120
+    delay = 0.25
+    successes = 0
+    while successes < 2 and time.monotonic() < deadline:
+        if _is_ready():
+            successes += 1
+            time.sleep(0.25)
+        else:
+            successes = 0
+            time.sleep(delay)
+            delay = min(delay * 2, 2)
 
     # Run tests
     yield
@@ -14,7 +14,7 @@ class File:
 
 
 def login(page: Page, username: str, password: str):
-    page.goto("http://localhost:8000/?hl=en")
+    page.goto("http://localhost:8000/?hl=en", wait_until="domcontentloaded")
     page.get_by_role("link", name="Log in").click()
     page.get_by_label("Username").click()
     page.get_by_label("Username").fill(username)
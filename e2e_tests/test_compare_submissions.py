@@ -54,7 +54,8 @@ def test_compare_submissions(page: Page) -> None:
 
     page.goto(
         "http://localhost:8000/def/current/programming_exercises/graderutils" +
-        "/programming_exercises_graderutils_iotester_exercise2/submissions/2/inspect/?compare_to=invalid"
+        "/programming_exercises_graderutils_iotester_exercise2/submissions/2/inspect/?compare_to=invalid",
+        wait_until="domcontentloaded",
     )
     expect(page.get_by_role("main")).to_contain_text(
         "The file you are attempting to compare to was not found.")
@@ -120,6 +120,13 @@ class ContentDBData(DBDataManager):
         for exercise in new_exercises:
             if exercise.parent_id is not None:
                 self.exercise_children.setdefault(exercise.parent_id, []).append(exercise)
+                # Parents are always in the same module, so they have been
+                # loaded by the same query. Linking them here lets number(),
+                # __str__() and get_path() walk the parent chain without
+                # querying the database for every level.
+                parent = self.exercises.get(exercise.parent_id)
+                if parent is not None:
+                    exercise.parent = parent
 
         for exercise in new_exercises:
             if exercise.course_module_id is not None:
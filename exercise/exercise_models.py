@@ -1,7 +1,7 @@
 from __future__ import annotations
 import json
 import os
-from typing import Any, TYPE_CHECKING, List, Optional, Tuple, TypeVar
+from typing import Any, Dict, TYPE_CHECKING, List, Optional, Tuple, TypeVar
 from urllib.parse import urlsplit
 
 from django.conf import settings
@@ -11,7 +11,7 @@ from django.core.exceptions import ValidationError, PermissionDenied
 from django.core.files.storage import default_storage
 from django.http.request import HttpRequest
 from django.db import models
-from django.db.models import signals
+from django.db.models import Count, signals
 from django.db.models.signals import post_delete, post_save
 from django.template import loader
 from django.utils import timezone
@@ -67,16 +67,25 @@ class LearningObjectManager(ModelWithInheritanceManager):
     def get_queryset(self):
         return (
             super().get_queryset()
-            .defer('description')
+            # The parent is joined, so its description is deferred too.
+            .defer('description', 'parent__description')
             .select_related(
                 'course_module',
                 'course_module__course_instance',
                 'course_module__course_instance__course',
                 'category',
+                'parent',
             )
-            .prefetch_related('parent')
         )
 
+    def with_content(self):
+        """
+        Returns the default queryset without deferring the description.
+        Use this when the description is going to be shown, e.g., on the page
+        of a single learning object, to avoid fetching it in a second query.
+        """
+        return self.get_queryset().defer(None)
+
     def find_enrollment_exercise(self, course_instance, is_external):
         exercise = None
         if is_external:
@@ -281,6 +290,9 @@ class LearningObject(LearningObjectProto, ModelWithInheritance):
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
+        # The url or the parent may have changed.
+        self.__dict__.pop('_parents', None)
+        self.__dict__.pop('_path', None)
         super().save(*args, **kwargs)
         # Trigger LearningObject post save signal for extending classes.
         cls = self.__class__
@@ -299,27 +311,26 @@ class LearningObject(LearningObjectProto, ModelWithInheritance):
                 signals.post_delete.send(sender=cls, instance=self)
 
     def _build_full_name(self, force_content_numbering=None, force_module_numbering=None):
-        content_numbering = (
-            self.course_instance.content_numbering
-            if force_content_numbering is None
-            else force_content_numbering
-        )
-        module_numbering = (
-            self.course_instance.module_numbering
-            if force_module_numbering is None
-            else force_module_numbering
-        )
-        if self.order >= 0:
-            if content_numbering == CourseInstance.CONTENT_NUMBERING.ARABIC:
-                number = self.number()
-                if module_numbering in (
-                        CourseInstance.CONTENT_NUMBERING.ARABIC,
-                        CourseInstance.CONTENT_NUMBERING.HIDDEN,
-                    ):
-                    return "{:d}.{} {}".format(self.course_module.order, number, self.name)
-                return "{} {}".format(number, self.name)
-            if content_numbering == CourseInstance.CONTENT_NUMBERING.ROMAN:
-                return "{} {}".format(roman_numeral(self.order), self.name)
+        if self.order < 0:
+            return self.name
+        content_numbering = force_content_numbering
+        module_numbering = force_module_numbering
+        if content_numbering is None or module_numbering is None:
+            course_instance = self.course_instance
+            if content_numbering is None:
+                content_numbering = course_instance.content_numbering
+            if module_numbering is None:
+                module_numbering = course_instance.module_numbering
+        if content_numbering == CourseInstance.CONTENT_NUMBERING.ARABIC:
+            number = self.number()
+            if module_numbering in (
+                    CourseInstance.CONTENT_NUMBERING.ARABIC,
+                    CourseInstance.CONTENT_NUMBERING.HIDDEN,
+                ):
+                return "{:d}.{} {}".format(self.course_module.order, number, self.name)
+            return "{} {}".format(number, self.name)
+        if content_numbering == CourseInstance.CONTENT_NUMBERING.ROMAN:
+            return "{} {}".format(roman_numeral(self.order), self.name)
         return self.name
 
     def __str__(self):
@@ -334,13 +345,17 @@ class LearningObject(LearningObjectProto, ModelWithInheritance):
     def number(self):
         return ".".join([str(o.order) for o in self.parent_list()])
 
+    def get_path(self) -> str:
+        if not hasattr(self, '_path'):
+            self._path = super().get_path()
+        return self._path
+
     def parent_list(self):
         if not hasattr(self, '_parents'):
-            def recursion(obj, parents):
-                if obj is not None:
-                    return recursion(obj.parent, [obj] + parents)
-                return parents
-            self._parents = recursion(self.parent, [self])
+            # Reuse the parent's memoized list so that siblings sharing the
+            # same parent instance only walk the chain once.
+            parent = self.parent
+            self._parents = (parent.parent_list() if parent is not None else []) + [self]
         return self._parents
 
     @property
@@ -807,13 +822,15 @@ class BaseExercise(LearningObject):
         return False, alerts
 
     def one_has_deadline_deviation(self, students):
-        deviation = None
-        for profile in students:
-            for d in self.deadlineruledeviation_set.filter(submitter=profile):
-                if not deviation\
-                        or d.get_new_deadline() > deviation.get_new_deadline():
-                    deviation = d
-        return deviation
+        # All the deviations extend the same module closing time, so the one
+        # with the most extra time has the latest new deadline.
+        deviations = self.deadlineruledeviation_set
+        return (
+            deviations
+            .filter(submitter__in=students)
+            .order_by(deviations.max_order_by)
+            .first()
+        )
 
     def number_of_submitters(self):
         return self.course_instance.students\
@@ -838,6 +855,39 @@ class BaseExercise(LearningObject):
             return self.max_submissions + deviation.extra_submissions
         return self.max_submissions
 
+    def _max_submissions_for_students(self, students: List[UserProfile]) -> Dict[int, int]:
+        """
+        Same as `max_submissions_for_student`, but fetches the deviations of
+        all the given students in one query. Returns a dict keyed by the
+        user profile id.
+        """
+        extra = dict(
+            self.maxsubmissionsruledeviation_set
+            .filter(submitter__in=students)
+            .values_list('submitter_id', 'extra_submissions')
+        )
+        return {
+            profile.id: self.max_submissions + extra.get(profile.id, 0)
+            for profile in students
+        }
+
+    def _submission_counts_for_students(self, students: List[UserProfile]) -> Dict[int, int]:
+        """
+        Counts the official, non-error submissions of the given students in
+        one grouped query. Returns a dict keyed by the user profile id.
+        Students without submissions are not included in the dict.
+        """
+        counts = (
+            self.submissions
+            .exclude_errors()
+            .exclude_unofficial()
+            .filter(submitters__in=students)
+            .values('submitters__id')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        return {row['submitters__id']: row['count'] for row in counts}
+
     def one_has_submissions(self, students: List[UserProfile]) -> Tuple[bool, List[str]]:
         alerts = {
             'error_messages': [],
@@ -850,12 +900,14 @@ class BaseExercise(LearningObject):
             if not enrollment or enrollment.status != Enrollment.ENROLLMENT_STATUS.ACTIVE:
                 return True, alerts
         submission_count = 0
+        max_submissions = self._max_submissions_for_students(students)
+        submission_counts = self._submission_counts_for_students(students)
         for profile in students:
             # The students are in the same group, therefore, each student should
             # have the same submission count. However, max submission deviation
             # may be set for only one group member.
-            submission_count = self.get_submissions_for_student(profile, True, True).count()
-            if submission_count < self.max_submissions_for_student(profile):
+            submission_count = submission_counts.get(profile.id, 0)
+            if submission_count < max_submissions[profile.id]:
                 return True, alerts
         # Even in situations where the student could otherwise make an infinite
         # number of submissions, there is still a hard limit.
@@ -880,9 +932,10 @@ class BaseExercise(LearningObject):
                 return False
         if self.max_submissions == 0:
             return False
+        max_submissions = self._max_submissions_for_students(students)
+        submission_counts = self._submission_counts_for_students(students)
         for profile in students:
-            if self.get_submissions_for_student(profile, True, True).count() \
-                    <= self.max_submissions_for_student(profile):
+            if submission_counts.get(profile.id, 0) <= max_submissions[profile.id]:
                 return False
         return True
 
@@ -959,7 +1012,8 @@ class BaseExercise(LearningObject):
 
         if self.max_group_size > 1:
             # Check groups cannot be changed after submitting.
-            submission = self.get_submissions_for_student(profile).first()
+            # Only the submitters of the submission are needed here.
+            submission = self.get_submissions_for_student(profile).only('id').first()
             if submission:
                 if self._detect_group_changes(profile, group, submission):
                     msg = _('EXERCISE_ERROR_GROUP_CANNOT_CHANGE_FOR_SAME_EXERCISE_MSG')
@@ -1038,16 +1092,16 @@ class BaseExercise(LearningObject):
 
     def _detect_submissions(self, profile, group):
         if group:
-            return not all((
-                len(self.get_submissions_for_student(p)) == 0
+            return any(
+                self.get_submissions_for_student(p).exists()
                 for p in group.members.all() if p != profile
-            ))
+            )
         return False
 
     def get_total_submitter_count(self):
-        return UserProfile.objects \
-            .filter(submissions__exercise=self) \
-            .distinct().count()
+        return self.submissions.aggregate(
+            count=Count('submitters', distinct=True),
+        )['count']
 
     def get_load_url( # pylint: disable=too-many-arguments
             self,
@@ -1494,10 +1548,10 @@ class ExerciseWithAttachment(BaseExercise):
         """
         Returns a list of the file names that user should submit with this exercise.
         """
-        if len(self.files_to_submit.strip()) == 0:
+        files_to_submit = self.files_to_submit.strip()
+        if not files_to_submit:
             return []
-        files = self.files_to_submit.split("|")
-        return [filename.strip() for filename in files]
+        return [filename.strip() for filename in files_to_submit.split("|")]
 
     def load(
             self,
@@ -1511,9 +1565,10 @@ class ExerciseWithAttachment(BaseExercise):
 
         # Adds the submission form to the content if there are files to be
         # submitted. A template is used to avoid hard-coded HTML here.
-        if self.get_files_to_submit():
+        files = self.get_files_to_submit()
+        if files:
             template = loader.get_template('exercise/model/_file_submit_form.html')
-            context = {'files' : self.get_files_to_submit()}
+            context = {'files' : files}
             page.content += template.render(context)
 
         return page
@@ -1521,10 +1576,11 @@ class ExerciseWithAttachment(BaseExercise):
     def modify_post_parameters(self, data, files, user, students, request, url): # pylint: disable=too-many-arguments
         """
         Adds the attachment file to post parameters.
+        The file is closed by Submission.clean_post_parameters.
         """
         files['content_0'] = (
-            os.path.basename(self.attachment.path),
-            open(self.attachment.path, "rb") # pylint: disable=consider-using-with
+            os.path.basename(self.attachment.name),
+            default_storage.open(self.attachment.name, "rb"),
         )
 
 
@@ -52,8 +52,11 @@ def load_feedback_page(request, url, exercise, submission, no_penalties=False):
     page = ExercisePage(exercise)
     try:
         data, files = submission.get_post_parameters(request, url)
-        remote_page = RemotePage(url, post=True, data=data, files=files, instance_id=exercise.course_instance.id)
-        submission.clean_post_parameters()
+        try:
+            remote_page = RemotePage(url, post=True, data=data, files=files, instance_id=exercise.course_instance.id)
+        finally:
+            # Close the file handles even if the request fails.
+            submission.clean_post_parameters()
         parse_page_content(page, remote_page, exercise)
     except RemotePageException:
         page.errors.append(_('ASSESSMENT_SERVICE_ERROR_CONNECTION_FAILED'))
@@ -426,6 +426,43 @@ class ExerciseTest(ExerciseTestBase):
         )
         self.assertTrue(self.base_exercise.one_has_submissions([self.user.userprofile])[0])
 
+    def test_base_exercise_group_submission_deviation(self):
+        user3 = User.objects.create(username="testUser3")
+        exercise = BaseExercise.objects.create(
+            name="test group exercise",
+            course_module=self.course_module,
+            category=self.learning_object_category,
+            url="b4",
+            max_submissions=2,
+        )
+        group = [self.user.userprofile, self.user2.userprofile]
+        for _ in range(3):
+            submission = Submission.objects.create(
+                exercise=exercise,
+                grader=self.grader.userprofile
+            )
+            submission.submitters.add(*group)
+        self.assertFalse(exercise.one_has_submissions(group)[0])
+        self.assertTrue(exercise.no_submissions_left(group))
+
+        # A member without submissions has submissions left.
+        self.assertTrue(exercise.one_has_submissions([user3.userprofile])[0])
+        self.assertFalse(exercise.no_submissions_left([user3.userprofile]))
+        self.assertTrue(exercise.one_has_submissions(group + [user3.userprofile])[0])
+        self.assertFalse(exercise.no_submissions_left(group + [user3.userprofile]))
+
+        # The deviation of one member is enough for the group.
+        MaxSubmissionsRuleDeviation.objects.create(
+            exercise=exercise,
+            submitter=self.user2.userprofile,
+            granter=self.teacher.userprofile,
+            extra_submissions=2
+        )
+        self.assertTrue(exercise.one_has_submissions(group)[0])
+        self.assertFalse(exercise.no_submissions_left(group))
+        self.assertFalse(exercise.one_has_submissions([self.user.userprofile])[0])
+        self.assertTrue(exercise.no_submissions_left([self.user.userprofile]))
+
     def test_base_exercise_deadline_deviation(self):
         self.assertFalse(self.old_base_exercise.one_has_access([self.user.userprofile])[0])
         deviation = DeadlineRuleDeviation.objects.create( # pylint: disable=unused-variable
@@ -436,6 +473,27 @@ class ExerciseTest(ExerciseTestBase):
         )
         self.assertTrue(self.old_base_exercise.one_has_access([self.user.userprofile])[0])
 
+    def test_base_exercise_group_deadline_deviation(self):
+        group = [self.user.userprofile, self.user2.userprofile]
+        self.assertIsNone(self.old_base_exercise.one_has_deadline_deviation(group))
+        DeadlineRuleDeviation.objects.create(
+            exercise=self.old_base_exercise,
+            submitter=self.user.userprofile,
+            granter=self.teacher.userprofile,
+            extra_seconds=24*60*60 # One day
+        )
+        longest = DeadlineRuleDeviation.objects.create(
+            exercise=self.old_base_exercise,
+            submitter=self.user2.userprofile,
+            granter=self.teacher.userprofile,
+            extra_seconds=10*24*60*60 # Ten days
+        )
+        self.assertEqual(self.old_base_exercise.one_has_deadline_deviation(group), longest)
+        self.assertEqual(
+            self.old_base_exercise.one_has_deadline_deviation([self.user.userprofile]).extra_seconds,
+            24*60*60
+        )
+
     def test_base_exercise_total_submission_count(self):
         self.assertEqual(self.base_exercise.get_total_submitter_count(), 2)
         self.assertEqual(self.static_exercise.get_total_submitter_count(), 0)
@@ -2,6 +2,7 @@ from lib.testdata import CourseTestCase
 from course.models import CourseInstance, CourseModule, LearningObjectCategory
 from deviations.models import MaxSubmissionsRuleDeviation
 from exercise.tests import ExerciseTestBase
+from .cache.basetypes import ContentDBData
 from .cache.content import CachedContent, InstanceContent, LearningObjectContent, ModuleContent
 from .cache.hierarchy import previous_iterator
 from .cache.points import (
@@ -306,6 +307,15 @@ class CachedContentTest(CourseTestCase):
         self.assertEqual(nex.type, 'module')
         self.assertEqual(nex.id, self.module2.id)
 
+    def test_load_modules_queries(self):
+        data = ContentDBData()
+        # The modules, their requirements and the learning objects with
+        # their subclasses, each in a single query.
+        with self.assertNumQueries(3):
+            data._load_modules_qs(CourseModule.objects.filter(course_instance=self.instance))
+        self.assertIsInstance(data.exercises[self.exercise.id], StaticExercise)
+        self.assertIsInstance(data.exercises[self.exercise0.id], BaseExercise)
+
 
 class CachedExercisePointsTest(ExerciseTestBase):
     def test_no_invalidation(self):
@@ -121,7 +121,7 @@ class ExerciseMixin(ExerciseRevealRuleMixin, ExerciseBaseMixin, CourseModuleMixi
                 self.module.id,
                 self.kwargs[self.exercise_kw]
             )
-            return LearningObject.objects.get(id=exercise_id)
+            return LearningObject.objects.with_content().get(id=exercise_id)
         except (NoSuchContent, LearningObject.DoesNotExist) as exc:
             raise Http404("Learning object not found") from exc
 
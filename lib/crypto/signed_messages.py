@@ -3,6 +3,7 @@ import hmac
 import random
 import time
 from base64 import urlsafe_b64encode, urlsafe_b64decode
+from functools import lru_cache
 from django.conf import settings
 
 
@@ -32,12 +33,16 @@ NONCE_BYTES = 4
 HASH_METHOD = hashlib.sha256
 HASH_SIZE = HASH_METHOD().digest_size
 
+@lru_cache(maxsize=1)
+def _keyed_hmac(secret):
+    # Keying the HMAC hashes the padded secret, so it is done once and the
+    # keyed state is copied for every signature.
+    return hmac.new(secret.encode('utf-8'), digestmod=HASH_METHOD)
+
 def _signature(stamp, nonce, payload):
-    return hmac.new(
-        settings.SECRET_KEY.encode('utf-8'),
-        msg=stamp + nonce + payload,
-        digestmod=HASH_METHOD
-    ).digest()
+    signature = _keyed_hmac(settings.SECRET_KEY).copy()
+    signature.update(stamp + nonce + payload)
+    return signature.digest()
 
 
 def get_signed_message(msg):
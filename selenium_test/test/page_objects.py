@@ -1,7 +1,8 @@
 from enum import Enum
 import json
 
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -31,24 +32,37 @@ class CourseName(Enum):
 
 class AbstractPage:
     base_url = "http://localhost:8001"
+    # Form fields whose values getFieldValue reads with a single script call.
+    FIELD_LOCATORS = ()
 
     def __init__(self, driver, base_url=base_url):
         self.driver = driver
         self.base_url = base_url
         self.wait_timeout = 10
         self.condition_wait_timeout = 10
+        # Used for waits on purely client-side actions, such as opening a
+        # dropdown.
+        self.fast_wait_timeout = 3
+        self.poll_frequency = 0.1
+        # Elements found on the current page, keyed by locator. Navigation
+        # replaces the DOM, so the cache is cleared whenever it happens.
+        self._element_cache = {}
+        self._field_values = None
+
+    def clearElementCache(self):
+        self._element_cache.clear()
+        self._field_values = None
 
     def load(self, url, loaded_check=None):
         url = self.base_url + url
+        self.clearElementCache()
         self.driver.get(url)
         if loaded_check:
             self.waitForElement(loaded_check)
-        # The log command is not supported.
-        #self.checkBrowserErrors()
 
-    def openDropdown(self, link, dest, timeout=None): # pylint: disable=unused-argument
+    def openDropdown(self, link, dest, timeout=None):
         self.getElement(link).click()
-        self.waitForVisibleElement(dest)
+        self.waitForVisibleElement(dest, timeout or self.fast_wait_timeout)
 
     def clickThrough(self, element, timeout=None):
         try:
@@ -58,50 +72,69 @@ class AbstractPage:
 
     def clickThroughElement(self, link, timeout=None):
         link.click()
+        self.clearElementCache()
         try:
-            WebDriverWait(self.driver, timeout or self.wait_timeout).until(EC.staleness_of(link))
+            WebDriverWait(
+                self.driver, timeout or self.wait_timeout, poll_frequency=self.poll_frequency,
+            ).until(EC.staleness_of(link))
         except TimeoutException as exc:
             raise TimeoutException("Link staleness failed after click") from exc
 
     def waitForElement(self, element, timeout=None):
         try:
-            WebDriverWait(self.driver, timeout or self.wait_timeout).until(EC.presence_of_element_located(element))
+            WebDriverWait(
+                self.driver, timeout or self.wait_timeout, poll_frequency=self.poll_frequency,
+            ).until(EC.presence_of_element_located(element))
         except TimeoutException as exc:
             raise TimeoutException("Wait for element failed: {0}".format(element)) from exc
 
-    def waitForVisibleElement(self, element):
+    def waitForElements(self, *elements, timeout=None):
+        condition = EC.all_of(*(EC.presence_of_element_located(element) for element in elements))
         try:
-            WebDriverWait(self.driver, self.wait_timeout).until(EC.visibility_of_element_located(element))
+            WebDriverWait(
+                self.driver, timeout or self.wait_timeout, poll_frequency=self.poll_frequency,
+            ).until(condition)
+        except TimeoutException as exc:
+            raise TimeoutException("Wait for elements failed: {0}".format(elements)) from exc
+
+    def waitForVisibleElement(self, element, timeout=None):
+        try:
+            WebDriverWait(
+                self.driver, timeout or self.wait_timeout, poll_frequency=self.poll_frequency,
+            ).until(EC.visibility_of_element_located(element))
         except TimeoutException as exc:
             raise TimeoutException("Wait for element visibility failed: {0}".format(element)) from exc
 
-    def waitForCondition(self, condition):
+    def waitForCondition(self, condition, timeout=None):
         try:
-            WebDriverWait(self.driver, self.condition_wait_timeout).until(condition)
+            WebDriverWait(
+                self.driver, timeout or self.condition_wait_timeout, poll_frequency=self.poll_frequency,
+            ).until(condition)
         except TimeoutException as exc:
             raise TimeoutException("Wait for condition failed: {0}".format(condition)) from exc
 
     def waitForAjax(self):
+        # The browser calls back once no requests are active, so the wait
+        # takes a single round-trip instead of polling jQuery.active.
+        script = (
+            "var callback = arguments[arguments.length - 1];"
+            "if (jQuery.active === 0) { callback(); return; }"
+            "jQuery(document).one('ajaxStop', function () { callback(); });"
+        )
         try:
-            WebDriverWait(self.driver, self.wait_timeout).until(
-                lambda driver: driver.execute_script("return jQuery.active") == 0
-            )
+            self.driver.set_script_timeout(self.wait_timeout)
+            self.driver.execute_async_script(script)
         except TimeoutException as exc:
             raise TimeoutException("Wait for Ajax timed out.") from exc
-
-    def checkBrowserErrors(self):
-        errors = []
-        for entry in self.driver.get_log("browser"):
-            if (entry['level'] == "ERROR"):
-                errors.append(entry['message'])
-
-        if (len(errors) > 0):
-            for error in errors:
-                print(error)
-            raise Exception("Browser errors found") # pylint: disable=broad-exception-raised
+        # The Ajax response may have replaced parts of the page.
+        self.clearElementCache()
 
     def getElement(self, locator):
-        return self.driver.find_element(*locator)
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self.driver.find_element(*locator)
+            self._element_cache[locator] = element
+        return element
 
     def getElements(self, locator):
         return self.driver.find_elements(*locator)
@@ -110,27 +143,88 @@ class AbstractPage:
         self.waitForCondition(EC.alert_is_present())
         return self.driver.switch_to.alert
 
+    def _checkElement(self, locator, check, fallback):
+        # Finds the element and checks it in the browser with one script call,
+        # so that a missing element does not wait for a NoSuchElementException.
+        # Other locator strategies are checked with find_elements and the
+        # fallback function instead.
+        by, selector = locator
+        if by == By.XPATH:
+            find = (
+                "var element = document.evaluate(arguments[0], document, null,"
+                " XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+            )
+        elif by == By.CSS_SELECTOR:
+            find = "var element = document.querySelector(arguments[0]);"
+        else:
+            elements = self.driver.find_elements(*locator)
+            return bool(elements) and fallback(elements[0])
+        return bool(self.driver.execute_script(find + check, selector))
+
     def isElementVisible(self, locator):
-        try:
-            element = self.getElement(locator)
-            return element.is_displayed()
-        except NoSuchElementException:
-            return False
+        return self._checkElement(
+            locator,
+            "if (!element) { return false; }"
+            "var rect = element.getBoundingClientRect();"
+            "return rect.width > 0 && rect.height > 0"
+            " && getComputedStyle(element).visibility !== 'hidden';",
+            lambda element: element.is_displayed(),
+        )
 
     def isElementPresent(self, locator):
-        try:
-            _ = self.getElement(locator)
-            return True
-        except NoSuchElementException:
-            return False
+        return self._checkElement(locator, "return !!element;", lambda element: True)
+
+    def readValues(self, locators):
+        """
+        Reads the values of the input elements matched by the given locators.
+        XPath and CSS locators are read together in one script call, other
+        locator strategies with find_element. Returns a dict keyed by the
+        locator.
+        """
+        scripted = [locator for locator in locators if locator[0] in (By.XPATH, By.CSS_SELECTOR)]
+        values = {}
+        if scripted:
+            script = (
+                "var xpath = arguments[1];"
+                "return arguments[0].map(function (locator) {"
+                "  var element = locator[0] === xpath"
+                "    ? document.evaluate(locator[1], document, null,"
+                "        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+                "    : document.querySelector(locator[1]);"
+                "  return element ? element.value : null;"
+                "});"
+            )
+            results = self.driver.execute_script(script, [list(locator) for locator in scripted], By.XPATH)
+            values.update(zip(scripted, results))
+        for locator in locators:
+            if locator not in values:
+                values[locator] = self.driver.find_element(*locator).get_attribute('value')
+        return values
+
+    def getFieldValue(self, locator):
+        if self._field_values is None:
+            self._field_values = self.readValues(self.FIELD_LOCATORS)
+        return self._field_values[locator]
 
     def clearAndSendKeys(self, locator, text):
-        element = self.getElement(locator)
-        element.clear()
+        self._field_values = None
+        # Clearing in a script saves the separate clear command per field.
+        script = (
+            "arguments[0].value = '';"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+        )
+        try:
+            element = self.getElement(locator)
+            self.driver.execute_script(script, element)
+        except StaleElementReferenceException:
+            # The cached element was replaced without navigation.
+            self._element_cache.pop(locator, None)
+            element = self.getElement(locator)
+            self.driver.execute_script(script, element)
         element.send_keys(text)
 
     def getJSON(self):
-        return json.loads(self.driver.find_element_by_tag_name("body").text)
+        return json.loads(self.driver.execute_script("return document.body.textContent"))
 
 
 class LoginPage(AbstractPage):
@@ -141,18 +235,24 @@ class LoginPage(AbstractPage):
     assistantUsername = "assistant_user" # noqa: N815
     teacherUsername = "teacher_user" # noqa: N815
     superuserUsername = "user" # noqa: N815
+    # Opening a course anonymously redirects to the login page with the course
+    # as the next page, so the login page is opened directly.
+    _COURSE_LOGIN_PATHS = {
+        CourseName.APLUS: "/accounts/login/?next=/aplus1/basic_instance/",
+        CourseName.HOOK: "/accounts/login/?next=/aplus1/hook_instance/",
+    }
 
     def __init__(self, driver):
+        # loginToCourse opens the login page, so the front page is not loaded.
         AbstractPage.__init__(self, driver)
-        self.load("", FirstPageLocators.BANNER)
 
     def loginToCourse(self, course, username=defaultUsername, password=defaultPassword):
-        if (course == CourseName.APLUS):
-            self.clickThrough(FirstPageLocators.APLUS_TEST_COURSE_INSTANCE_BUTTON)
-        elif (course == CourseName.HOOK):
-            self.clickThrough(FirstPageLocators.HOOK_EXAMPLE_BUTTON)
-        self.waitForElement(LoginPageLocators.BANNER)
-        self.waitForElement(BasePageLocators.FOOTER)
+        try:
+            path = self._COURSE_LOGIN_PATHS[course]
+        except KeyError as exc:
+            raise ValueError(f"Unknown course: {course}") from exc
+        self.load(path)
+        self.waitForElements(LoginPageLocators.BANNER, BasePageLocators.FOOTER)
         self.signIn(username, password)
 
     def loginAsStudent(self, course=CourseName.APLUS):
@@ -171,8 +271,7 @@ class LoginPage(AbstractPage):
         self.getElement(LoginPageLocators.USERNAME_INPUT).send_keys(username)
         self.getElement(LoginPageLocators.PASSWORD_INPUT).send_keys(password)
         self.clickThrough(LoginPageLocators.SUBMIT_BUTTON)
-        self.waitForElement(BasePageLocators.LOGGED_USER_LINK)
-        self.waitForElement(BasePageLocators.FOOTER)
+        self.waitForElements(BasePageLocators.LOGGED_USER_LINK, BasePageLocators.FOOTER)
 
 
 class BasePage(AbstractPage):
@@ -180,10 +279,10 @@ class BasePage(AbstractPage):
         AbstractPage.__init__(self, driver)
 
     def getCourseBanner(self):
-        return str(self.getElement(BasePageLocators.COURSE_BANNER).text)
+        return self.getElement(BasePageLocators.COURSE_BANNER).text
 
     def getLoggedInText(self):
-        return str(self.getElement(BasePageLocators.LOGGED_USER_LINK).text)
+        return self.getElement(BasePageLocators.LOGGED_USER_LINK).text
 
     def waitForPage(self):
         self.waitForElement(BasePageLocators.FOOTER)
@@ -191,44 +290,42 @@ class BasePage(AbstractPage):
     def logout(self):
         self.openDropdown(BasePageLocators.LOGGED_USER_LINK, BasePageLocators.LOGOUT_LINK)
         self.clickThrough(BasePageLocators.LOGOUT_LINK)
-        self.waitForPage()
 
     def clickHomeLink(self):
         self.clickThrough(BasePageLocators.HOME_LINK)
-        self.waitForPage()
 
     def clickCalendarFeedLink(self):
         self.clickThrough(BasePageLocators.CALENDAR_FEED_LINK)
-        self.waitForPage()
 
     def clickResultsLink(self):
         self.clickThrough(BasePageLocators.RESULTS_LINK)
-        self.waitForPage()
 
     def clickUserLink(self):
         self.clickThrough(BasePageLocators.USER_LINK)
-        self.waitForPage()
 
     def clickTeachersViewLink(self):
         self.clickThrough(BasePageLocators.TEACHERS_VIEW_LINK)
-        self.waitForPage()
 
     def hasNewNotifications(self):
         return self.isElementPresent(BasePageLocators.NOTIFICATION_ALERT)
 
 
 class HomePage(BasePage):
+    _PATHS = {
+        CourseName.APLUS: "/aplus1/basic_instance",
+        CourseName.HOOK: "/aplus1/hook_instance",
+    }
+
     def __init__(self, driver, course=CourseName.APLUS):
         BasePage.__init__(self, driver)
-        if (course == CourseName.APLUS):
-            path = "/aplus1/basic_instance"
-        elif (course == CourseName.HOOK):
-            path = "/aplus1/hook_instance"
-
+        try:
+            path = self._PATHS[course]
+        except KeyError as exc:
+            raise ValueError(f"Unknown course: {course}") from exc
         self.load(path, HomePageLocators.MAIN_SCORE)
 
     def getMainScore(self):
-        return str(self.getElement(HomePageLocators.MAIN_SCORE).text);
+        return self.getElement(HomePageLocators.MAIN_SCORE).text
 
     def clickFilterCategories(self):
         self.getElement(HomePageLocators.FILTER_CATEGORIES_BUTTON).click()
@@ -247,24 +344,35 @@ class HomePage(BasePage):
 class ExercisePage(BasePage):
     def __init__(self, driver):
         BasePage.__init__(self, driver)
+        self._score = None
+
+    def clearElementCache(self):
+        super().clearElementCache()
+        self._score = None
+
+    def _readScore(self):
+        # The points and the max points are read from the same element.
+        if self._score is None:
+            self._score = self.getElement(ExercisePageLocators.EXERCISE_SCORE).text
+        return self._score
 
     def getAllowedSubmissions(self):
-        return str(self.getElement(ExercisePageLocators.ALLOWED_SUBMISSIONS).text)
+        return self.getElement(ExercisePageLocators.ALLOWED_SUBMISSIONS).text
 
     def getExerciseScore(self):
-        return str(self.getElement(ExercisePageLocators.EXERCISE_SCORE).text)
+        return self._readScore()
 
     def getPoints(self):
-        return str(self.getElement(ExercisePageLocators.EXERCISE_SCORE).text).split(" / ", 1)[0]
+        return self._readScore().split(" / ", 1)[0]
 
     def getMaxPoints(self):
-        return str(self.getElement(ExercisePageLocators.EXERCISE_SCORE).text).split(" / ", 1)[1]
+        return self._readScore().split(" / ", 1)[1]
 
     def getNumberOfSubmitters(self):
-        return str(self.getElement(ExercisePageLocators.NUMBER_OF_SUBMITTERS).text)
+        return self.getElement(ExercisePageLocators.NUMBER_OF_SUBMITTERS).text
 
     def getAverageSubmissionsPerStudent(self):
-        return str(self.getElement(ExercisePageLocators.AVERAGE_SUBMISSIONS_PER_STUDENT).text)
+        return self.getElement(ExercisePageLocators.AVERAGE_SUBMISSIONS_PER_STUDENT).text
 
     def getMySubmissionsList(self):
         return self.getElements(ExercisePageLocators.MY_SUBMISSIONS_LIST)
@@ -277,23 +385,26 @@ class ExercisePage(BasePage):
 class StaffPage(BasePage):
     def __init__(self, driver):
         BasePage.__init__(self, driver)
+        self._submission_links = None
+
+    def clearElementCache(self):
+        super().clearElementCache()
+        self._submission_links = None
 
     def getSubmissionLinks(self):
-        return self.getElements(StaffPageLocators.SUBMISSION_LINKS)
+        if self._submission_links is None:
+            self._submission_links = self.getElements(StaffPageLocators.SUBMISSION_LINKS)
+        return self._submission_links
 
     def clickSubmissionLink(self, number):
         submissionLinks = self.getSubmissionLinks()
-        if (number <= len(submissionLinks)):
-            self.clickThroughElement(submissionLinks[number])
-            self.waitForPage()
-        else:
-            raise Exception( # pylint: disable=broad-exception-raised
-                "Tried to click submission link number "
-                + number
-                + " but there are only "
-                + len(submissionLinks)
-                + " elements."
+        if not 0 <= number < len(submissionLinks):
+            raise IndexError(
+                f"Tried to click submission link number {number} "
+                f"but there are only {len(submissionLinks)} elements."
             )
+        self.clickThroughElement(submissionLinks[number])
+        self.waitForPage()
 
 class TeachersPage(BasePage):
     def __init__(self, driver):
@@ -301,15 +412,18 @@ class TeachersPage(BasePage):
         self.load("/aplus1/basic_instance/teachers/", TeachersPageLocators.TEACHERS_VIEW_BANNER)
 
 class EditModulePage(BasePage):
+    FIELD_LOCATORS = (
+        EditModulePageLocators.COURSE_NAME_INPUT,
+        EditModulePageLocators.POINTS_TO_PASS_INPUT,
+        EditModulePageLocators.OPENING_TIME_INPUT,
+        EditModulePageLocators.CLOSING_TIME_INPUT,
+    )
+
     def __init__(self, driver, moduleNumber):
         BasePage.__init__(self, driver)
         if (moduleNumber):
             self.load(
-                (
-                    "/aplus1/basic_instance/teachers/module/"
-                    + str(moduleNumber)
-                    + "/"
-                ),
+                f"/aplus1/basic_instance/teachers/module/{moduleNumber}/",
                 EditModulePageLocators.EDIT_MODULE_PAGE_BANNER
             )
         else:
@@ -317,16 +431,16 @@ class EditModulePage(BasePage):
             self.load("/aplus1/basic_instance/teachers/module/add/", EditModulePageLocators.EDIT_MODULE_PAGE_BANNER)
 
     def getCourseName(self):
-        return str(self.getElement(EditModulePageLocators.COURSE_NAME_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditModulePageLocators.COURSE_NAME_INPUT)
 
     def getPointsToPass(self):
-        return str(self.getElement(EditModulePageLocators.POINTS_TO_PASS_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditModulePageLocators.POINTS_TO_PASS_INPUT)
 
     def getOpeningTime(self):
-        return str(self.getElement(EditModulePageLocators.OPENING_TIME_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditModulePageLocators.OPENING_TIME_INPUT)
 
     def getClosingTime(self):
-        return str(self.getElement(EditModulePageLocators.CLOSING_TIME_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditModulePageLocators.CLOSING_TIME_INPUT)
 
     def setCourseName(self, text):
         self.clearAndSendKeys(EditModulePageLocators.COURSE_NAME_INPUT, text)
@@ -342,35 +456,37 @@ class EditModulePage(BasePage):
 
     def submit(self):
         self.clickThrough(EditModulePageLocators.SUBMIT_BUTTON)
-        self.waitForElement(TeachersPageLocators.TEACHERS_VIEW_BANNER)
-        self.waitForPage()
+        self.waitForElements(TeachersPageLocators.TEACHERS_VIEW_BANNER, BasePageLocators.FOOTER)
 
     def isSuccessfulSave(self):
         return self.isElementVisible(EditModulePageLocators.SUCCESSFUL_SAVE_BANNER)
 
 class EditExercisePage(BasePage):
+    FIELD_LOCATORS = (
+        EditExercisePageLocators.EXERCISE_NAME_INPUT,
+        EditExercisePageLocators.MAX_SUBMISSIONS_INPUT,
+        EditExercisePageLocators.MAX_POINTS_INPUT,
+        EditExercisePageLocators.POINTS_TO_PASS_INPUT,
+    )
+
     def __init__(self, driver, exerciseNumber=1):
         BasePage.__init__(self, driver)
         self.load(
-            (
-                "/aplus1/basic_instance/teachers/exercise/"
-                + str(exerciseNumber)
-                + "/"
-            ),
+            f"/aplus1/basic_instance/teachers/exercise/{exerciseNumber}/",
             EditExercisePageLocators.EDIT_EXERCISE_PAGE_BANNER
         )
 
     def getExerciseName(self):
-        return str(self.getElement(EditExercisePageLocators.EXERCISE_NAME_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditExercisePageLocators.EXERCISE_NAME_INPUT)
 
     def getMaxSubmissions(self):
-        return str(self.getElement(EditExercisePageLocators.MAX_SUBMISSIONS_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditExercisePageLocators.MAX_SUBMISSIONS_INPUT)
 
     def getMaxPoints(self):
-        return str(self.getElement(EditExercisePageLocators.MAX_POINTS_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditExercisePageLocators.MAX_POINTS_INPUT)
 
     def getPointsToPass(self):
-        return str(self.getElement(EditExercisePageLocators.POINTS_TO_PASS_INPUT).get_attribute('value'))
+        return self.getFieldValue(EditExercisePageLocators.POINTS_TO_PASS_INPUT)
 
     def setExerciseName(self, text):
         self.clearAndSendKeys(EditExercisePageLocators.EXERCISE_NAME_INPUT, text)
@@ -395,57 +511,46 @@ class EditExercisePage(BasePage):
 class SubmissionPage(BasePage):
     def __init__(self, driver, moduleId="first-exercise-round", exerciseId="1"):
         BasePage.__init__(self, driver)
+        self._inspection_links = None
         self.load(
-            (
-                "/aplus1/basic_instance/"
-                + str(moduleId)
-                + "/"
-                + str(exerciseId)
-                + "/submissions/"
-            ),
+            f"/aplus1/basic_instance/{moduleId}/{exerciseId}/submissions/",
             SubmissionPageLocators.SUBMISSIONS_PAGE_BANNER)
 
+    def clearElementCache(self):
+        super().clearElementCache()
+        self._inspection_links = None
+
     def getInspectionLinks(self):
-        return self.getElements(SubmissionPageLocators.INSPECTION_LINKS)
+        if self._inspection_links is None:
+            self._inspection_links = self.getElements(SubmissionPageLocators.INSPECTION_LINKS)
+        return self._inspection_links
 
     def getSubmissionCount(self):
         return len(self.getInspectionLinks())
 
     def clickInspectionLink(self, number):
         inspectionLinks = self.getInspectionLinks()
-        if (len(inspectionLinks) >= number):
-            self.clickThroughElement(inspectionLinks.get(number))
-            self.waitForPage()
-        else:
-            raise Exception( # pylint: disable=broad-exception-raised
-                "Tried to click inspection link number "
-                + number
-                + " but there are only "
-                + len(inspectionLinks)
-                + " elements."
+        if not 0 <= number < len(inspectionLinks):
+            raise IndexError(
+                f"Tried to click inspection link number {number} "
+                f"but there are only {len(inspectionLinks)} elements."
             )
+        self.clickThroughElement(inspectionLinks[number])
+        self.waitForPage()
 
 class StudentFeedbackPage(BasePage):
     def __init__(self, driver, moduleId="first-exercise-round", exerciseId="1", submissionNumber=1):
         BasePage.__init__(self, driver)
         self.load(
-            (
-                "/aplus1/basic_instance/"
-                + str(moduleId)
-                + "/"
-                + str(exerciseId)
-                + "/submissions/"
-                + str(submissionNumber)
-                + "/"
-            ),
+            f"/aplus1/basic_instance/{moduleId}/{exerciseId}/submissions/{submissionNumber}/",
             StudentFeedbackPageLocators.ASSISTANT_FEEDBACK_LABEL
         )
 
     def getAssistantFeedbackText(self):
-        return str(self.getElement(StudentFeedbackPageLocators.ASSISTANT_FEEDBACK_TEXT).text).strip()
+        return self.getElement(StudentFeedbackPageLocators.ASSISTANT_FEEDBACK_TEXT).text.strip()
 
     def getFeedbackText(self):
-        return str(self.getElement(StudentFeedbackPageLocators.FEEDBACK_TEXT).text).strip()
+        return self.getElement(StudentFeedbackPageLocators.FEEDBACK_TEXT).text.strip()
 
 class InspectionPage(BasePage):
     def __init__(
@@ -457,15 +562,7 @@ class InspectionPage(BasePage):
             ) -> None:
         BasePage.__init__(self, driver)
         self.load(
-            (
-                "/aplus1/basic_instance/"
-                + str(moduleId)
-                + "/"
-                + str(exerciseId)
-                + "/submissions/"
-                + str(submissionNumber)
-                + "/inspect/"
-            ),
+            f"/aplus1/basic_instance/{moduleId}/{exerciseId}/submissions/{submissionNumber}/inspect/",
             InspectionPageLocators.ASSESSMENT_BUTTON
         )
 
@@ -508,8 +605,7 @@ class MyFirstExerciseGrader(ExercisePage):
 
     def submit(self):
         self.clickThrough(MyFirstExerciseLocators.SUBMIT_BUTTON)
-        self.waitForElement(ExercisePageLocators.RECEIVED_BANNER)
-        self.waitForPage()
+        self.waitForElements(ExercisePageLocators.RECEIVED_BANNER, BasePageLocators.FOOTER)
 
 
 class FileUploadGrader(ExercisePage):
@@ -522,8 +618,7 @@ class FileUploadGrader(ExercisePage):
         #script = "document.getElementById('myfile_id').value='/tmp/selenium_test_file';";
         #self.driver.execute_script(script)
         self.clickThrough(FileUploadGraderLocators.SUBMIT_BUTTON)
-        self.waitForElement(ExercisePageLocators.RECEIVED_BANNER)
-        self.waitForPage()
+        self.waitForElements(ExercisePageLocators.RECEIVED_BANNER, BasePageLocators.FOOTER)
 
 
 class MyAjaxExerciseGrader(ExercisePage):
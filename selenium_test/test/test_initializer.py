@@ -16,6 +16,9 @@ class TestInitializer:
     def getDefaultDriver(self, headless: bool = False, browser: str = "Firefox") -> WebDriver:
         driver = self.getDriver(headless, browser)
         driver.set_window_size(1024,768)
+        # The page objects use explicit waits only. An implicit wait would
+        # delay every lookup of an element that is not on the page.
+        driver.implicitly_wait(0)
         return driver
 
     def setupDisplay(self):